@@ -0,0 +1,198 @@
+"""
+모의 서버(mock_server.py)를 상대로 제출 파이프라인의 처리량과 메모리를 재는 벤치마크
+- problem.xlsx의 질문을 반복해 50 ~ 50,000행짜리 입력 파일을 만들고, 실제 서버 없이 전체 실행을 재현합니다.
+- --baseline으로 이전 결과(JSON)를 주면 처리량이 tolerance 이상 떨어진 크기가 있을 때 종료 코드 1을 반환합니다.
+
+실행 예: python benchmark.py --sizes 50 500 5000 --concurrency 32 --latency lognormal --latency-ms 200
+"""
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import multiprocessing
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from openpyxl import Workbook
+
+from data_loader import iter_questions
+from journal import ResultJournal
+from main import load_data, process_with_openai, process_with_openai_async
+from mock_server import add_mock_arguments
+from retry import RetryPolicy
+
+# 기본 입출력 경로는 실행 위치가 아니라 이 파일 위치를 기준으로 합니다.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_workload(source_path, size, output_path):
+    """source_path의 질문을 반복해 size행짜리 problem.xlsx 형식 파일을 만드는 함수"""
+    questions = [question for _, question in iter_questions(source_path)]
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(["id", "question"])
+    for id, question in zip(range(1, size + 1), itertools.cycle(questions)):
+        sheet.append([id, question])
+    workbook.save(output_path)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def mock_server_process(args):
+    """
+    모의 서버를 별도 프로세스로 띄우는 함수
+    - 같은 프로세스에서 돌리면 서버 스레드가 GIL을 두고 파이프라인과 경쟁하므로 측정값이 왜곡됩니다.
+    """
+    port = _free_port()
+    command = [
+        sys.executable, os.path.join(BASE_DIR, "mock_server.py"),
+        "--port", str(port),
+        "--latency", args.latency,
+        "--latency-ms", str(args.latency_ms),
+        "--error-rate", str(args.error_rate),
+        "--rate-limit-rate", str(args.rate_limit_rate),
+        "--max-rps", str(args.max_rps),
+        "--retry-after", str(args.retry_after),
+        "--slow-stream-ms", str(args.slow_stream_ms)
+    ]
+    if args.seed is not None:
+        command += ["--seed", str(args.seed)]
+
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    try:
+        # 서버가 포트를 열 때까지 기다립니다.
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("모의 서버를 시작하지 못했습니다.")
+                time.sleep(0.05)
+        yield f"http://127.0.0.1:{port}/submit/v1"
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위로 돌려줍니다.
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def run_once(size, base_url, args, workdir):
+    """
+    size행 입력으로 전체 파이프라인(로드 → 요청 → 저널 → 내보내기)을 한 번 실행하는 함수
+    - run_in_subprocess로 새 프로세스에서 실행해야 최대 메모리(peak RSS)가 크기별로 따로 측정됩니다.
+
+    :return: dict, 크기별 측정 결과
+    """
+    input_path = os.path.join(workdir, f"problem_{size}.xlsx")
+    output_path = os.path.join(workdir, f"results_{size}{args.output_format}")
+    make_workload(args.source, size, input_path)
+
+    journal = ResultJournal(os.path.join(workdir, f"journal_{size}.jsonl"))
+    policy = RetryPolicy(retry_budget=size)
+
+    started = time.perf_counter()
+    try:
+        # 질문마다 찍히는 로그는 측정을 왜곡하므로 버립니다.
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            if args.concurrency > 1:
+                summary = asyncio.run(process_with_openai_async(
+                    load_data(input_path), base_url, journal, args.concurrency, policy,
+                    output_path=output_path, dedupe=args.dedupe
+                ))
+            else:
+                summary = process_with_openai(
+                    load_data(input_path), base_url, journal, policy,
+                    output_path=output_path, dedupe=args.dedupe
+                )
+        elapsed = time.perf_counter() - started
+    finally:
+        journal.close()
+
+    return {
+        "size": size,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_per_second": round(summary["succeeded"] / elapsed, 2),
+        "succeeded": summary["succeeded"],
+        "failed": summary["failed"],
+        "retries": summary["retries"],
+        "latency_ms": summary["latency_ms"],
+        "export_seconds": summary["phases"].get("export", {}).get("seconds", 0.0),
+        "peak_memory_mb": round(_peak_rss_mb(), 1),
+        "output_bytes": os.path.getsize(output_path)
+    }
+
+
+def run_in_subprocess(size, base_url, args, workdir):
+    """run_once를 새 프로세스(spawn)에서 실행해 이전 크기의 메모리 사용량이나 캐시된 상태가 섞이지 않게 하는 함수"""
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(run_once, (size, base_url, args, workdir))
+
+
+def compare_with_baseline(results, baseline_path, tolerance):
+    """baseline보다 처리량이 tolerance 비율 이상 떨어진 크기 목록을 반환하는 함수"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {row["size"]: row for row in json.load(f)["results"]}
+
+    regressions = []
+    for row in results:
+        before = baseline.get(row["size"])
+        if before is None:
+            continue
+        if row["throughput_per_second"] < before["throughput_per_second"] * (1 - tolerance):
+            regressions.append((row["size"], before["throughput_per_second"], row["throughput_per_second"]))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs="+", default=[50, 500, 5000, 50000],
+                        help="실행할 입력 행 수")
+    parser.add_argument('--source', default=os.path.join(BASE_DIR, 'problem.xlsx'), help="질문을 가져올 원본 문제 파일")
+    parser.add_argument('--concurrency', type=int, default=32, help="동시에 진행할 최대 요청 수")
+    parser.add_argument('--output-format', choices=[".xlsx", ".jsonl", ".parquet"], default=".xlsx",
+                        help="결과 파일 형식")
+    parser.add_argument('--dedupe', action='store_true', help="prompt/context 원문을 한 번만 저장")
+    parser.add_argument('--out', default=os.path.join(BASE_DIR, 'bench_results.json'), help="측정 결과를 저장할 JSON 파일")
+    parser.add_argument('--baseline', default=None, help="비교할 이전 측정 결과 JSON 파일")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="허용하는 처리량 감소 비율")
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    results = []
+    with mock_server_process(args) as base_url, tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            row = run_in_subprocess(size, base_url, args, workdir)
+            results.append(row)
+            latency = row["latency_ms"] or {"p50": "-", "p99": "-"}
+            print(f"{size:>7}행: {row['elapsed_seconds']:>8.2f}초, 초당 {row['throughput_per_second']:>8.2f}건, "
+                  f"p50 {latency['p50']}ms, p99 {latency['p99']}ms, 실패 {row['failed']}건, "
+                  f"내보내기 {row['export_seconds']:.2f}초, 최대 메모리 {row['peak_memory_mb']}MB, "
+                  f"결과 파일 {row['output_bytes'] / 1024:.0f}KB")
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump({"config": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+    print(f"벤치마크 결과 저장 완료: {args.out}")
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.tolerance)
+        for size, before, after in regressions:
+            print(f"성능 저하: {size}행 처리량 초당 {before}건 → {after}건")
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,86 @@
+import csv
+import json
+import os
+from collections import namedtuple
+
+# 파이프라인으로 넘기는 가벼운 질문 레코드 (DataFrame 행 대신 사용)
+Question = namedtuple("Question", ["id", "question"])
+
+
+def _normalize_id(value):
+    """엑셀의 1.0, CSV의 "1" 같은 id를 정수로 맞추는 함수 (정수가 아니면 그대로 반환)"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return value
+
+
+def _iter_excel(file_path):
+    from openpyxl import load_workbook
+
+    # read_only 모드는 시트 전체를 메모리에 올리지 않고 행을 하나씩 읽습니다.
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(cell).strip() if cell is not None else "" for cell in next(rows, ())]
+        id_col, question_col = header.index("id"), header.index("question")
+        for row in rows:
+            # write-only로 저장된 시트는 뒤쪽의 빈 셀을 쓰지 않아 행이 헤더보다 짧을 수 있습니다.
+            yield (row[id_col] if id_col < len(row) else None,
+                   row[question_col] if question_col < len(row) else None)
+    finally:
+        workbook.close()
+
+
+def _iter_csv(file_path):
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            yield row["id"], row["question"]
+
+
+def _iter_jsonl(file_path):
+    with open(file_path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record.get("id"), record.get("question")
+
+
+def _iter_parquet(file_path, batch_size=1024):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet 파일을 읽으려면 pyarrow를 설치하세요: pip install pyarrow") from e
+
+    for batch in pq.ParquetFile(file_path).iter_batches(batch_size=batch_size, columns=["id", "question"]):
+        for record in batch.to_pylist():
+            yield record["id"], record["question"]
+
+
+READERS = {
+    ".xlsx": _iter_excel,
+    ".xlsm": _iter_excel,
+    ".csv": _iter_csv,
+    ".jsonl": _iter_jsonl,
+    ".parquet": _iter_parquet,
+}
+
+
+def iter_questions(file_path):
+    """
+    문제 파일을 한 행씩 읽어 Question(id, question)을 돌려주는 제너레이터
+    - 파일 전체를 파싱하기 전에 첫 질문부터 바로 처리할 수 있습니다.
+    - id나 question이 비어 있는 행은 건너뜁니다.
+
+    :param file_path: str, .xlsx/.csv/.jsonl/.parquet 파일 경로
+    :return: generator, Question 레코드
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in READERS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {file_path} (지원: {', '.join(READERS)})")
+
+    for id, question in READERS[extension](file_path):
+        if id is None or id == "" or question is None or str(question).strip() == "":
+            continue
+        yield Question(_normalize_id(id), str(question))
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+
+from journal import to_builtin
+
+COLUMNS = ["id", "question", "prompt", "context", "response", "score", "reasoning"]
+
+# 모든 행에서 거의 같은 긴 텍스트가 반복되는 컬럼 (dedupe 시 해시 참조로 바꿈)
+SHARED_COLUMNS = ["prompt", "context"]
+
+
+def _text_hash(text):
+    return hashlib.sha256(str(text).encode("utf-8")).hexdigest()[:16]
+
+
+def dedupe_shared(results, shared):
+    """
+    prompt/context 원문을 shared에 한 번만 모으고, 행에는 해시만 남기는 제너레이터
+
+    :param results: iterable, 결과 dict
+    :param shared: dict, {해시: 원문} (이 함수가 채웁니다)
+    :return: generator, prompt_hash/context_hash 컬럼을 가진 결과 dict
+    """
+    for result in results:
+        row = dict(result)
+        for column in SHARED_COLUMNS:
+            text = row.pop(column, "") or ""
+            key = _text_hash(text)
+            shared.setdefault(key, text)
+            row[column + "_hash"] = key
+        yield row
+
+
+def _columns(dedupe):
+    if not dedupe:
+        return COLUMNS
+    return [c + "_hash" if c in SHARED_COLUMNS else c for c in COLUMNS]
+
+
+def _shared_path(output_path):
+    base, extension = os.path.splitext(output_path)
+    return base + ".shared" + extension
+
+
+def export_jsonl(rows, output_path, columns, shared=None):
+    """결과를 한 줄씩 JSONL로 쓰는 함수 (shared가 있으면 .shared.jsonl에 원문을 따로 씀)"""
+    with open(output_path, "w", encoding="utf-8") as f:
+        for row in rows:
+            record = {column: row.get(column, "") for column in columns}
+            f.write(json.dumps(record, ensure_ascii=False, default=to_builtin) + "\n")
+
+    if shared is not None:
+        with open(_shared_path(output_path), "w", encoding="utf-8") as f:
+            for key, text in shared.items():
+                f.write(json.dumps({"hash": key, "text": text}, ensure_ascii=False) + "\n")
+
+
+def export_xlsx(rows, output_path, columns, shared=None):
+    """openpyxl write-only 모드로 엑셀을 쓰는 함수 (shared가 있으면 shared 시트에 원문을 씀)"""
+    from openpyxl import Workbook
+
+    # write-only 모드는 셀 객체를 메모리에 쌓지 않고 행을 바로 파일로 내보냅니다.
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("results")
+    sheet.append(columns)
+    for row in rows:
+        sheet.append([row.get(column, "") for column in columns])
+
+    if shared is not None:
+        shared_sheet = workbook.create_sheet("shared")
+        shared_sheet.append(["hash", "text"])
+        for key, text in shared.items():
+            shared_sheet.append([key, text])
+    workbook.save(output_path)
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def export_parquet(rows, output_path, columns, shared=None, batch_size=1024):
+    """
+    결과를 Parquet으로 쓰는 함수
+    - 문자열 컬럼은 딕셔너리 인코딩되므로, 행마다 반복되는 prompt/context는 파일에 한 번만 저장됩니다.
+    - batch_size 행씩 나누어 써서 전체 결과를 한 번에 Arrow 테이블로 만들지 않습니다.
+    - 스키마는 columns로 미리 정합니다. (id는 정수, score는 실수, 나머지는 문자열이며 값이 없으면 null)
+      첫 배치의 값으로 추론하면 값이 모두 비어 있을 때 null 타입이 되어 이후 배치를 쓸 수 없기 때문입니다.
+    - xlsx/jsonl처럼 id는 정수로 저장하고, 정수가 아닌 id가 나오면 그때까지 쓴 파일의 id 컬럼을 문자열로 바꿔 이어 씁니다.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet으로 저장하려면 pyarrow를 설치하세요: pip install pyarrow") from e
+
+    def make_schema(id_type):
+        return pa.schema([
+            (column, id_type if column == "id" else pa.float64() if column == "score" else pa.string())
+            for column in columns
+        ])
+
+    def open_writer(path, schema):
+        return pq.ParquetWriter(path, schema, use_dictionary=True, compression="zstd")
+
+    def convert(column, value):
+        if value is None:
+            return None
+        if column == "id":
+            return value if _is_int(value) and int_ids else str(value)
+        return _to_float(value) if column == "score" else str(value)
+
+    def flush():
+        records = [{column: convert(column, row.get(column)) for column in columns} for row in batch]
+        writer.write_table(pa.Table.from_pylist(records, schema=writer.schema))
+        batch.clear()
+
+    int_ids = True
+    tmp_path = None
+    batch = []
+    # 결과가 하나도 없어도 컬럼만 있는 파일이 남도록 writer를 미리 엽니다.
+    writer = open_writer(output_path, make_schema(pa.int64()))
+    try:
+        for row in rows:
+            id = row.get("id")
+            if int_ids and id is not None and not _is_int(id):
+                # 이미 쓴 행의 id를 문자열로 바꿔 임시 파일에 옮기고, 끝나면 원래 경로로 교체합니다.
+                writer.close()
+                int_ids = False
+                tmp_path = f"{output_path}.{os.getpid()}.tmp"
+                writer = open_writer(tmp_path, make_schema(pa.string()))
+                for written in pq.ParquetFile(output_path).iter_batches(batch_size=batch_size):
+                    writer.write_table(pa.Table.from_batches([written]).cast(writer.schema))
+            batch.append(row)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+    finally:
+        writer.close()
+    if tmp_path is not None:
+        os.replace(tmp_path, output_path)
+
+    if shared is not None:
+        shared_schema = pa.schema([("hash", pa.string()), ("text", pa.string())])
+        table = pa.Table.from_pylist(
+            [{"hash": key, "text": str(text)} for key, text in shared.items()], schema=shared_schema
+        )
+        pq.write_table(table, _shared_path(output_path), compression="zstd")
+
+
+EXPORTERS = {
+    ".xlsx": export_xlsx,
+    ".jsonl": export_jsonl,
+    ".parquet": export_parquet,
+}
+
+
+def export_results(results, output_path, dedupe=False):
+    """
+    결과를 출력 파일 확장자에 맞는 형식으로 저장하는 함수
+
+    :param results: iterable, 결과 dict
+    :param output_path: str, .xlsx/.jsonl/.parquet 파일 경로
+    :param dedupe: bool, True이면 prompt/context 원문은 한 번만 저장하고 행에는 해시만 남김
+    """
+    extension = os.path.splitext(output_path)[1].lower()
+    if extension not in EXPORTERS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {output_path} (지원: {', '.join(EXPORTERS)})")
+
+    shared = {} if dedupe else None
+    rows = dedupe_shared(results, shared) if dedupe else results
+    EXPORTERS[extension](rows, output_path, _columns(dedupe), shared)
@@ -0,0 +1,157 @@
+import json
+import os
+
+
+def to_builtin(value):
+    """numpy 스칼라 등 json이 모르는 값을 기본 타입으로 바꾸는 함수"""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+class ResultJournal:
+    """
+    처리가 끝난 결과를 한 줄씩 바로 기록하는 JSONL 저널
+    - 결과가 도착할 때마다 파일에 추가(append)하고 flush하므로, 실행이 중간에 끊겨도 완료된 결과는 남습니다.
+    - resume=True이면 기존 저널을 이어서 쓰고, 이미 성공한 id는 completed_ids로 알려줍니다.
+    - 같은 id가 여러 번 기록되면 마지막 기록을 사용합니다.
+    - 결과 자체는 메모리에 두지 않고 id별 마지막 기록의 파일 위치(byte offset)만 기억하며,
+      load_results는 그 위치에서 한 줄씩 읽어 돌려줍니다.
+    - 재시도 후에도 실패한 id는 failed_path(저널 옆의 .failed.jsonl)에 따로 기록되며,
+      requeue=True이면 지난 실행에서 실패한 id만 다시 처리합니다.
+    - 이전 실패 목록은 close()까지 그대로 두고, 이번 실행의 실패는 .tmp 파일에 따로 쌓습니다.
+      close()에서 아직 처리하지 못한 이전 실패와 새 실패를 합쳐 failed_path를 교체하므로,
+      --requeue/--resume 실행이 중간에 끊겨도 남은 실패 id가 사라지지 않습니다.
+    """
+
+    def __init__(self, path, resume=False, requeue=False):
+        self.path = path
+        self.failed_path = os.path.splitext(path)[0] + ".failed.jsonl"
+        self._pending_path = self.failed_path + ".tmp"
+        resume = resume or requeue
+        if not resume:
+            for old_path in (path, self.failed_path, self._pending_path):
+                if os.path.exists(old_path):
+                    os.remove(old_path)
+        # id별 마지막 기록의 파일 위치
+        self._offsets = {}
+        for offset, record in self._scan():
+            self._offsets[str(record["id"])] = offset
+        self.completed_ids = set(self._offsets)
+
+        # 이전 실패 목록 (강제 종료로 .tmp에 남은 실패도 합침)
+        self._previous_failures = {}
+        for failed_path in (self.failed_path, self._pending_path):
+            for record in self._read(failed_path):
+                self._previous_failures[str(record["id"])] = record
+        if os.path.exists(self._pending_path):
+            self._write_failures(self._previous_failures.values())
+
+        self.requeue_ids = set(self._previous_failures) if requeue else None
+        self.failed_ids = set()
+        self._failed_file = open(self._pending_path, "w", encoding="utf-8")
+        self._file = open(path, "ab")
+        if self._file.tell() > 0 and not self._ends_with_newline():
+            # 강제 종료로 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄을 바꿔 둡니다.
+            self._file.write(b"\n")
+
+    def _ends_with_newline(self):
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _scan(self):
+        """저널의 (파일 위치, 기록) 쌍을 차례로 돌려주는 제너레이터"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    yield offset, json.loads(line)
+                except json.JSONDecodeError:
+                    # 강제 종료로 잘린 줄은 무시
+                    pass
+                offset += len(line)
+
+    def _read(self, path):
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # 강제 종료로 마지막 줄이 잘린 경우 무시
+                    continue
+
+    def should_skip(self, id):
+        """이미 성공했거나, requeue 모드에서 실패 목록에 없는 id인지 확인하는 함수"""
+        if str(id) in self.completed_ids:
+            return True
+        return self.requeue_ids is not None and str(id) not in self.requeue_ids
+
+    def append(self, result):
+        """결과 한 건을 저널에 기록하는 함수"""
+        offset = self._file.tell()
+        self._file.write((json.dumps(result, ensure_ascii=False, default=to_builtin) + "\n").encode("utf-8"))
+        self._file.flush()
+        self._offsets[str(result["id"])] = offset
+        self.completed_ids.add(str(result["id"]))
+
+    def record_failure(self, id, error):
+        """재시도 후에도 실패한 id를 실패 목록에 기록하는 함수"""
+        record = {"id": id, "error": str(error)}
+        self._failed_file.write(json.dumps(record, ensure_ascii=False, default=to_builtin) + "\n")
+        self._failed_file.flush()
+        self.failed_ids.add(str(id))
+
+    def load_results(self, order=None):
+        """
+        저널에 기록된 결과를 하나씩 읽어 돌려주는 함수
+        - 전체 결과를 리스트로 만들지 않으므로, 내보내기 메모리가 행 수에 비례해 늘지 않습니다.
+
+        :param order: list, id 정렬 순서 (여기에 없는 id는 뒤에 기록 순서대로 붙습니다)
+        :return: generator, 결과 dict
+        """
+        self._file.flush()
+        offsets = dict(self._offsets)
+        ordered = []
+        for id in order or []:
+            offset = offsets.pop(str(id), None)
+            if offset is not None:
+                ordered.append(offset)
+        ordered.extend(sorted(offsets.values()))
+        return self._read_at(ordered)
+
+    def _read_at(self, offsets):
+        with open(self.path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                yield json.loads(f.readline())
+
+    def _write_failures(self, records):
+        """실패 목록을 임시 파일에 쓴 뒤 failed_path와 교체하는 함수"""
+        tmp_path = f"{self.failed_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, default=to_builtin) + "\n")
+        os.replace(tmp_path, self.failed_path)
+        if os.path.exists(self._pending_path):
+            os.remove(self._pending_path)
+
+    def close(self):
+        self._file.close()
+        self._failed_file.close()
+
+        # 이전 실패 중 이번에 성공하지도, 다시 실패하지도 않은(아직 처리하지 못한) id는 남기고 새 실패를 더합니다.
+        failures = {
+            id: record for id, record in self._previous_failures.items()
+            if id not in self.completed_ids and id not in self.failed_ids
+        }
+        for record in self._read(self._pending_path):
+            failures[str(record["id"])] = record
+        self._write_failures(failures.values())
+
+        if failures:
+            print(f"실패 {len(failures)}건: {self.failed_path}에 기록됨 (--requeue로 다시 제출)")
@@ -0,0 +1,117 @@
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class RunMetrics:
+    """
+    한 번의 실행에서 요청 지연 시간, 토큰 사용량, 단계별 소요 시간을 모으는 클래스
+    - timer("prompt"/"export")와 record_request("request")로 단계별 시간을 누적합니다. (비동기 실행에서는 워커들의 시간이 합산됩니다)
+    - record_request로 질문별 네트워크 지연 시간(재시도 포함)과 토큰 사용량을 기록합니다.
+      재시도 끝에 실패한 요청도 기록되므로, 지연 시간 백분위수에는 실패까지 걸린 시간이 포함됩니다.
+    - summary()는 p50/p95/p99 지연 시간, 처리량, 질문당 토큰 수, 에러율을 dict로 반환합니다.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.latencies = []
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        # usage를 돌려받은(성공한) 요청 수: 질문당 토큰 수의 분모
+        self.usage_count = 0
+        self.succeeded = 0
+        self.cached = 0
+        self.failed = 0
+        self.retries = 0
+        self.phases = defaultdict(lambda: {"count": 0, "seconds": 0.0})
+
+    @contextmanager
+    def timer(self, phase):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[phase]["count"] += 1
+            self.phases[phase]["seconds"] += time.perf_counter() - started
+
+    def record_request(self, latency, usage=None):
+        """서버에 요청한 질문 하나의 지연 시간(초)과 usage 객체를 기록하는 함수 (실패한 요청은 usage 없이 기록)"""
+        self.latencies.append(latency)
+        self.phases["request"]["count"] += 1
+        self.phases["request"]["seconds"] += latency
+        if usage is not None:
+            self.usage_count += 1
+            self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+            self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+
+    def record_success(self, cached=False):
+        self.succeeded += 1
+        if cached:
+            self.cached += 1
+
+    def record_failure(self):
+        self.failed += 1
+
+    def summary(self):
+        """실행 요약을 JSON으로 저장할 수 있는 dict로 반환하는 함수"""
+        elapsed = time.perf_counter() - self.started
+        total = self.succeeded + self.failed
+        requested = self.usage_count
+
+        latency_ms = None
+        if self.latencies:
+            p50, p95, p99 = np.percentile(np.array(self.latencies) * 1000, [50, 95, 99])
+            latency_ms = {
+                "p50": round(float(p50), 1),
+                "p95": round(float(p95), 1),
+                "p99": round(float(p99), 1),
+                "max": round(max(self.latencies) * 1000, 1)
+            }
+
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "questions": total,
+            "succeeded": self.succeeded,
+            "cached": self.cached,
+            "failed": self.failed,
+            "retries": self.retries,
+            "error_rate": round(self.failed / total, 4) if total else 0.0,
+            "throughput_per_second": round(self.succeeded / elapsed, 3) if elapsed else 0.0,
+            "latency_ms": latency_ms,
+            "tokens": {
+                "prompt": self.prompt_tokens,
+                "completion": self.completion_tokens,
+                "prompt_per_question": round(self.prompt_tokens / requested, 1) if requested else 0.0,
+                "completion_per_question": round(self.completion_tokens / requested, 1) if requested else 0.0
+            },
+            "phases": {
+                phase: {
+                    "count": value["count"],
+                    "seconds": round(value["seconds"], 3),
+                    "mean_ms": round(value["seconds"] / value["count"] * 1000, 2) if value["count"] else 0.0
+                }
+                for phase, value in self.phases.items()
+            }
+        }
+
+    def report(self, output_path=None):
+        """실행 요약을 출력하고, output_path가 있으면 JSON으로 저장하는 함수"""
+        summary = self.summary()
+        latency = summary["latency_ms"] or {"p50": "-", "p95": "-", "p99": "-"}
+        tokens = summary["tokens"]
+        print("\n===== 실행 요약 =====")
+        print(f"질문 {summary['questions']}건: 성공 {summary['succeeded']}건 (캐시 {summary['cached']}건), "
+              f"실패 {summary['failed']}건, 에러율 {summary['error_rate'] * 100:.1f}%, 재시도 {summary['retries']}회")
+        print(f"소요 시간 {summary['elapsed_seconds']:.1f}초, 처리량 초당 {summary['throughput_per_second']:.2f}건")
+        print(f"지연 시간(ms): p50 {latency['p50']}, p95 {latency['p95']}, p99 {latency['p99']}")
+        print(f"질문당 토큰: 프롬프트 {tokens['prompt_per_question']}, 응답 {tokens['completion_per_question']}")
+        for phase, value in summary["phases"].items():
+            print(f"단계 {phase}: {value['count']}회, 합계 {value['seconds']:.2f}초, 평균 {value['mean_ms']:.1f}ms")
+
+        if output_path:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(summary, f, ensure_ascii=False, indent=2)
+        return summary
@@ -0,0 +1,260 @@
+"""
+/submit/v1 채점 서버를 흉내 내는 로컬 모의(mock) 서버
+- OpenAI chat.completions 형식으로 응답하고, process_with_openai가 읽는
+  result 필드 {prompt, context, response, score, reasoning}를 함께 돌려줍니다.
+- 지연 시간 분포, 500/429 에러 주입, 초당 요청 한도, 느린 전송(slow-stream)을 설정할 수 있습니다.
+
+실행 예: python mock_server.py --port 8000 --latency lognormal --latency-ms 300 --error-rate 0.01
+요청 주소: http://127.0.0.1:8000/submit/v1
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SOURCE_MARKER = "<BEGIN SOURCE>"
+
+
+class MockConfig:
+    """모의 서버 동작 설정"""
+
+    def __init__(self, latency="fixed", latency_ms=100.0, error_rate=0.0, rate_limit_rate=0.0,
+                 max_rps=0.0, retry_after=1.0, slow_stream_ms=0.0, chunk_size=256, seed=None):
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.max_rps = max_rps
+        self.retry_after = retry_after
+        self.slow_stream_ms = slow_stream_ms
+        self.chunk_size = chunk_size
+        self.random = random.Random(seed)
+
+    def sample_latency(self):
+        """설정한 분포에서 응답 지연 시간(초)을 뽑는 함수 (평균이 latency_ms가 되도록 맞춤)"""
+        mean = self.latency_ms / 1000.0
+        if self.latency == "uniform":
+            return self.random.uniform(0, 2 * mean)
+        if self.latency == "exponential":
+            return self.random.expovariate(1.0 / mean) if mean > 0 else 0.0
+        if self.latency == "lognormal":
+            # sigma=0.8인 로그정규분포: 대부분 빠르고 가끔 매우 느린 꼬리 지연을 흉내 냅니다.
+            sigma = 0.8
+            return self.random.lognormvariate(0, sigma) * mean / math.exp(sigma ** 2 / 2)
+        return mean
+
+
+class TokenBucket:
+    """초당 max_rps개까지만 허용하는 토큰 버킷 (넘으면 429)"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+def build_completion(body, question_id, rng=random):
+    """
+    요청 본문으로 chat.completion 응답과 result 필드를 만드는 함수
+
+    :param rng: random.Random, score를 뽑을 난수 생성기 (--seed 재현을 위해 MockConfig.random을 넘김)
+    """
+    messages = body.get("messages", [])
+    user_message = next((m.get("content", "") for m in reversed(messages) if m.get("role") == "user"), "")
+    prompt, _, context = user_message.partition(SOURCE_MARKER)
+    answer = f"[mock] 질문 {question_id}에 대한 답변입니다."
+    prompt_tokens = sum(len(m.get("content", "")) for m in messages) // 2
+
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "olympiad"),
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": answer}
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(answer) // 2,
+            "total_tokens": prompt_tokens + len(answer) // 2
+        },
+        "result": {
+            "prompt": prompt.strip(),
+            "context": context.strip(),
+            "response": answer,
+            "score": round(rng.random() * 10, 2),
+            "reasoning": "[mock] 모의 서버가 생성한 채점 근거입니다."
+        }
+    }
+
+
+class MockServer(ThreadingHTTPServer):
+    """요청마다 스레드를 쓰는 HTTP 서버 (동시 연결이 몰려도 SYN이 버려지지 않도록 backlog를 늘림)"""
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def make_handler(config):
+    bucket = TokenBucket(config.max_rps) if config.max_rps > 0 else None
+
+    class MockHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # 헤더와 본문을 따로 보내므로 Nagle 알고리즘을 끄지 않으면 응답마다 ~40ms가 더해집니다.
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status, payload, headers=None):
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self._write_slowly(data)
+
+        def _write_slowly(self, data):
+            """slow_stream_ms가 있으면 chunk_size 바이트마다 쉬면서 본문을 보냅니다."""
+            if config.slow_stream_ms <= 0:
+                self.wfile.write(data)
+                return
+            for i in range(0, len(data), config.chunk_size):
+                self.wfile.write(data[i:i + config.chunk_size])
+                self.wfile.flush()
+                time.sleep(config.slow_stream_ms / 1000.0)
+
+        def _send_stream(self, completion):
+            """stream=True 요청에는 답변을 글자 단위 SSE 청크로 보냅니다."""
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+            def write_chunk(payload):
+                data = f"data: {payload}\n\n".encode("utf-8")
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+            answer = completion["choices"][0]["message"]["content"]
+            for char in answer:
+                chunk = {
+                    "id": completion["id"],
+                    "object": "chat.completion.chunk",
+                    "created": completion["created"],
+                    "model": completion["model"],
+                    "choices": [{"index": 0, "delta": {"content": char}, "finish_reason": None}]
+                }
+                write_chunk(json.dumps(chunk, ensure_ascii=False))
+                time.sleep(config.slow_stream_ms / 1000.0)
+            write_chunk("[DONE]")
+            self.wfile.write(b"0\r\n\r\n")
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            raw = self.rfile.read(length)
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+                return
+            try:
+                body = json.loads(raw or b"{}")
+            except json.JSONDecodeError:
+                self._send_json(400, {"error": {"message": "invalid JSON body"}})
+                return
+
+            if bucket is not None and not bucket.take():
+                self._send_json(429, {"error": {"message": "rate limit exceeded"}},
+                                {"Retry-After": str(config.retry_after)})
+                return
+
+            time.sleep(config.sample_latency())
+
+            roll = config.random.random()
+            if roll < config.rate_limit_rate:
+                self._send_json(429, {"error": {"message": "rate limit exceeded"}},
+                                {"Retry-After": str(config.retry_after)})
+                return
+            if roll < config.rate_limit_rate + config.error_rate:
+                self._send_json(500, {"error": {"message": "injected server error"}})
+                return
+
+            completion = build_completion(body, self.headers.get("Question-ID", ""), config.random)
+            if body.get("stream"):
+                self._send_stream(completion)
+            else:
+                self._send_json(200, completion)
+
+    return MockHandler
+
+
+def start_mock_server(config, host="127.0.0.1", port=0):
+    """
+    모의 서버를 백그라운드 스레드에서 실행하는 함수
+
+    :param config: MockConfig, 서버 동작 설정
+    :param port: int, 포트 (0이면 빈 포트를 자동으로 고름)
+    :return: tuple, (서버 객체, base_url)
+    """
+    server = MockServer((host, port), make_handler(config))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/submit/v1"
+
+
+def add_mock_arguments(parser):
+    """모의 서버 설정 인자를 parser에 추가하는 함수 (benchmark.py와 공유)"""
+    parser.add_argument('--latency', choices=["fixed", "uniform", "exponential", "lognormal"], default="fixed",
+                        help="응답 지연 시간 분포")
+    parser.add_argument('--latency-ms', type=float, default=100.0, help="평균 응답 지연 시간(ms)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="500 에러를 돌려줄 확률")
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help="429를 무작위로 돌려줄 확률")
+    parser.add_argument('--max-rps', type=float, default=0.0, help="초당 허용 요청 수 (넘으면 429, 0이면 제한 없음)")
+    parser.add_argument('--retry-after', type=float, default=1.0, help="429 응답의 Retry-After(초)")
+    parser.add_argument('--slow-stream-ms', type=float, default=0.0,
+                        help="본문 청크(또는 SSE 글자)마다 쉬는 시간(ms)")
+    parser.add_argument('--seed', type=int, default=None, help="난수 시드")
+
+
+def config_from_args(args):
+    return MockConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        max_rps=args.max_rps,
+        retry_after=args.retry_after,
+        slow_stream_ms=args.slow_stream_ms,
+        seed=args.seed
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8000)
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockServer((args.host, args.port), make_handler(config_from_args(args)))
+    print(f"모의 서버 실행 중: http://{args.host}:{args.port}/submit/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
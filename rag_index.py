@@ -0,0 +1,221 @@
+import hashlib
+import json
+import os
+import re
+import zipfile
+from functools import lru_cache
+
+import numpy as np
+
+# 인덱스 설정: 값을 바꾸면 저장된 인덱스의 지문(fingerprint)이 달라져 자동으로 다시 생성됩니다.
+NGRAM_RANGE = (2, 3)
+PASSAGE_SIZE = 500
+BM25_K1 = 1.5
+BM25_B = 0.75
+INDEX_VERSION = 2
+
+# 질의가 얻을 수 있는 최대 점수 대비 이 비율 미만인 단락은 관련 없는 것으로 보고 버립니다.
+# ("설명하", "무엇인" 같은 흔한 n-gram만 겹친 단락이 근거로 들어가지 않도록 함)
+MIN_RELATIVE_SCORE = 0.3
+
+_SPLIT_PATTERN = re.compile(r"(?=###)")
+_TOKEN_PATTERN = re.compile(r"[^\w]+")
+
+
+def char_ngrams(text):
+    """
+    텍스트를 글자 n-gram 리스트로 변환하는 함수
+    - 한국어는 조사/어미가 붙어 단어 단위 매칭이 어려우므로, 어절마다 글자 n-gram을 만듭니다.
+    - n보다 짧은 어절은 어절 자체를 하나의 토큰으로 사용합니다.
+
+    :param text: str, 원문
+    :return: list, n-gram 토큰 리스트
+    """
+    grams = []
+    for word in _TOKEN_PATTERN.split(text.lower()):
+        if not word:
+            continue
+        if len(word) < NGRAM_RANGE[0]:
+            grams.append(word)
+            continue
+        for n in range(NGRAM_RANGE[0], NGRAM_RANGE[1] + 1):
+            grams.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return grams
+
+
+def split_passages(context):
+    """context를 '###' 소제목 기준으로 나누고, PASSAGE_SIZE 글자 이하의 단락으로 묶는 함수"""
+    passages = []
+    current = ""
+    for section in _SPLIT_PATTERN.split(context):
+        section = section.strip()
+        # 소제목 하나가 너무 길면 글자 수 기준으로 자릅니다.
+        while len(section) > PASSAGE_SIZE:
+            if current:
+                passages.append(current)
+                current = ""
+            passages.append(section[:PASSAGE_SIZE])
+            section = section[PASSAGE_SIZE:]
+        if current and len(current) + len(section) > PASSAGE_SIZE:
+            passages.append(current)
+            current = ""
+        current += section
+    if current:
+        passages.append(current)
+    return passages
+
+
+class RagIndex:
+    """
+    context.json 단락에 대한 BM25 검색 인덱스
+    - 단락마다 BM25 가중치를 미리 계산한 (단락 수 x 어휘 수) 행렬을 보관하므로,
+      질의는 해당 n-gram 열을 더하는 NumPy 연산 한 번으로 끝납니다.
+    - 점수가 질의의 최대 점수(어휘에 있는 질의 n-gram이 모두 포화될 만큼 등장할 때)의 MIN_RELATIVE_SCORE 미만이면 결과에서 뺍니다.
+    """
+
+    def __init__(self, vocab, weights, idf, ids, questions, passages):
+        self.vocab = vocab
+        self.weights = weights
+        self.idf = idf
+        self.ids = ids
+        self.questions = questions
+        self.passages = passages
+
+    @classmethod
+    def build(cls, records):
+        """{id, question, context} 레코드 리스트로 인덱스를 생성하는 함수"""
+        ids, questions, passages, docs = [], [], [], []
+        for record in records:
+            # context가 비어 있는 레코드는 검색할 정보가 없으므로 제외합니다.
+            for passage in split_passages(record.get("context") or ""):
+                ids.append(record["id"])
+                questions.append(record["question"])
+                passages.append(passage)
+                # 질문 문장도 함께 색인해 같은 질문이 들어오면 해당 단락이 우선 검색되도록 합니다.
+                docs.append(char_ngrams(record["question"] + " " + passage))
+
+        vocab = {}
+        for doc in docs:
+            for gram in doc:
+                vocab.setdefault(gram, len(vocab))
+
+        tf = np.zeros((len(docs), len(vocab)), dtype=np.float32)
+        for row, doc in enumerate(docs):
+            cols, counts = np.unique([vocab[gram] for gram in doc], return_counts=True)
+            tf[row, cols] = counts
+
+        # BM25 가중치 계산
+        doc_len = tf.sum(axis=1, keepdims=True)
+        avg_len = doc_len.mean() if len(docs) else 1.0
+        df = (tf > 0).sum(axis=0)
+        idf = np.log(1.0 + (len(docs) - df + 0.5) / (df + 0.5)).astype(np.float32)
+        norm = BM25_K1 * (1.0 - BM25_B + BM25_B * doc_len / avg_len)
+        weights = idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+
+        return cls(vocab, weights.astype(np.float32), idf, ids, questions, passages)
+
+    def search(self, query, top_k=3):
+        """
+        질문과 관련도가 높은 단락을 찾는 함수
+
+        :param query: str, 질문
+        :param top_k: int, 반환할 최대 단락 수
+        :return: list, {id, question, context, score} 리스트 (점수 내림차순)
+        """
+        grams = char_ngrams(query)
+        cols = [self.vocab[gram] for gram in grams if gram in self.vocab]
+        if not cols or not self.passages:
+            return []
+        cols, counts = np.unique(cols, return_counts=True)
+        counts = counts.astype(np.float32)
+        scores = self.weights[:, cols] @ counts
+
+        # 질의의 최대 점수: 어휘에 있는 질의 n-gram이 한 단락에 충분히 등장할 때의 점수로,
+        # BM25의 tf 항이 (k1 + 1)에 수렴하므로 idf * (k1 + 1)의 합입니다.
+        # 어휘에 없는 n-gram은 어느 단락에서도 점수를 낼 수 없으므로 넣지 않습니다.
+        # (넣으면 질문을 거의 그대로 베낀 경우만 남고, 표현이 다른 관련 질문의 단락이 모두 걸러집니다)
+        max_score = float(self.idf[cols] @ counts) * (BM25_K1 + 1.0)
+        min_score = MIN_RELATIVE_SCORE * max_score
+
+        top_k = min(top_k, len(scores))
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best])]
+        return [
+            {
+                "id": self.ids[i],
+                "question": self.questions[i],
+                "context": self.passages[i],
+                "score": float(scores[i])
+            }
+            for i in best if scores[i] > 0 and scores[i] >= min_score
+        ]
+
+    def save(self, path, fingerprint):
+        """인덱스를 npz 파일로 저장하는 함수 (임시 파일에 쓴 뒤 교체하므로 중간에 끊겨도 기존 파일이 깨지지 않음)"""
+        vocab = sorted(self.vocab, key=self.vocab.get)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                fingerprint=np.array(fingerprint),
+                vocab=np.array(vocab, dtype=str),
+                weights=self.weights,
+                idf=self.idf,
+                ids=np.array(self.ids),
+                questions=np.array(self.questions, dtype=str),
+                passages=np.array(self.passages, dtype=str)
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, fingerprint):
+        """저장된 인덱스를 읽는 함수 (없거나, 깨졌거나, 원본 데이터나 설정이 바뀌었으면 None 반환)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as saved:
+                if str(saved["fingerprint"]) != fingerprint:
+                    return None
+                vocab = {gram: i for i, gram in enumerate(saved["vocab"].tolist())}
+                return cls(
+                    vocab,
+                    saved["weights"],
+                    saved["idf"],
+                    saved["ids"].tolist(),
+                    saved["questions"].tolist(),
+                    saved["passages"].tolist()
+                )
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+            print(f"RAG 인덱스를 읽지 못해 다시 생성합니다: {e}")
+            return None
+
+
+def _fingerprint(raw):
+    settings = f"{INDEX_VERSION}|{NGRAM_RANGE}|{PASSAGE_SIZE}|{BM25_K1}|{BM25_B}"
+    return hashlib.sha256(settings.encode("utf-8") + raw).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_index(context_path="context.json", index_path=None):
+    """
+    검색 인덱스를 반환하는 함수
+    - 디스크에 저장된 인덱스가 있으면 그대로 읽고, 없거나 오래되었으면 새로 만들어 저장합니다.
+    - 한 번 읽은 인덱스는 프로세스가 끝날 때까지 재사용합니다.
+
+    :param context_path: str, {id, question, context} 레코드가 담긴 JSON 파일
+    :param index_path: str, 인덱스 저장 경로 (기본값: context_path 옆의 .index.npz)
+    :return: RagIndex
+    """
+    if index_path is None:
+        index_path = os.path.splitext(context_path)[0] + ".index.npz"
+
+    with open(context_path, "rb") as f:
+        raw = f.read()
+    fingerprint = _fingerprint(raw)
+
+    index = RagIndex.load(index_path, fingerprint)
+    if index is None:
+        index = RagIndex.build(json.loads(raw))
+        index.save(index_path, fingerprint)
+        print(f"RAG 인덱스 생성 완료: 단락 {len(index.passages)}개, 어휘 {len(index.vocab)}개")
+    return index
@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class ResponseCache:
+    """
+    최종 메시지 내용으로 주소를 정하는 디스크 응답 캐시
+    - (model, temperature, messages)를 직렬화한 값의 SHA-256을 키로 사용하므로,
+      프롬프트가 한 글자라도 바뀐 질문만 다시 요청하게 됩니다.
+    - 항목은 cache_dir/<키 앞 2글자>/<키>.json 파일로 저장됩니다.
+    - max_age(초)보다 오래된 항목은 지우고, 전체 크기가 max_bytes를 넘으면 오래 사용하지 않은 항목부터 지웁니다.
+      put마다 전체 크기를 누적하다가 max_bytes를 넘으면 그때 evict()로 EVICT_TARGET 비율까지 줄입니다.
+    - get/put은 비동기 실행에서 asyncio.to_thread로 호출되므로 카운터와 크기 누적은 lock으로 보호합니다.
+    """
+
+    # 한도를 넘을 때마다 디렉터리를 다시 훑지 않도록 max_bytes의 이 비율까지 줄여 둡니다.
+    EVICT_TARGET = 0.9
+
+    def __init__(self, cache_dir, max_age=7 * 24 * 3600, max_bytes=200 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.evict()
+
+    @staticmethod
+    def key(model, temperature, messages):
+        """요청 내용으로 캐시 키를 만드는 함수"""
+        payload = json.dumps(
+            {"model": model, "temperature": temperature, "messages": messages},
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+    def get(self, key):
+        """
+        캐시된 result dict를 반환하는 함수
+
+        :param key: str, ResponseCache.key로 만든 키
+        :return: dict 또는 None, 캐시된 result (없거나 만료되었으면 None)
+        """
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.max_age:
+                os.remove(path)
+                self.evictions += 1
+                raise FileNotFoundError(path)
+            with open(path, encoding="utf-8") as f:
+                result = json.load(f)
+            # 최근 사용 시각을 갱신해 크기 기준 삭제 시 뒤로 밀리도록 합니다.
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """result dict를 캐시에 저장하는 함수"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+        size = os.path.getsize(tmp_path)
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.stores += 1
+            self.total_bytes += size - replaced
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def evict(self):
+        """만료된 항목을 지우고, 크기 제한을 넘으면 오래 사용하지 않은 항목부터 지우는 함수"""
+        with self._lock:
+            self._evict()
+
+    def _evict(self):
+        now = time.time()
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    # 다른 프로세스가 먼저 지웠거나 교체 중인 임시 파일
+                    continue
+                if now - stat.st_mtime > self.max_age:
+                    os.remove(path)
+                    self.evictions += 1
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            target = self.max_bytes * self.EVICT_TARGET
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                self.evictions += 1
+        self.total_bytes = total
+
+    def report(self):
+        total = self.hits + self.misses
+        hit_rate = self.hits / total * 100 if total else 0.0
+        print(f"캐시 통계: 적중 {self.hits}회, 미적중 {self.misses}회 (적중률 {hit_rate:.1f}%), "
+              f"저장 {self.stores}회, 삭제 {self.evictions}회")
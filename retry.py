@@ -0,0 +1,186 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+from openai import APIConnectionError, APIStatusError, RateLimitError
+
+# 재시도할 만한 HTTP 상태 코드 (429와 5xx는 별도로 처리)
+RETRYABLE_STATUS = {408, 409}
+
+
+def retry_after(error):
+    """
+    에러 응답의 Retry-After(또는 retry-after-ms) 헤더를 초 단위로 반환하는 함수
+
+    :param error: Exception, 요청 중 발생한 에러
+    :return: float 또는 None, 서버가 요구한 대기 시간
+    """
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return float(value) / 1000.0
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        # HTTP-date 형식 (예: "Wed, 21 Oct 2015 07:28:00 GMT")
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error):
+    """네트워크 에러, 429, 5xx 등 다시 시도하면 성공할 수 있는 에러인지 확인하는 함수"""
+    if isinstance(error, (APIConnectionError, RateLimitError)):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code >= 500 or error.status_code in RETRYABLE_STATUS
+    return False
+
+
+class RetryPolicy:
+    """
+    지수 백오프 재시도 정책
+    - 대기 시간은 base_delay * 2^attempt를 상한으로 하는 full jitter 방식으로 정합니다.
+    - 서버가 Retry-After를 주면 그 값을 따르되, max_delay보다 길면 max_delay만큼 기다립니다.
+      (429의 Retry-After는 AdaptiveRateLimiter가 전체 요청을 그 시간만큼 멈추므로 실제로는 끝까지 기다리게 됩니다)
+    - retry_budget은 한 실행 전체에서 허용하는 재시도 횟수로, 서버 장애 시 재시도 폭주를 막습니다.
+    """
+
+    def __init__(self, max_attempts=5, base_delay=0.5, max_delay=30.0, retry_budget=100):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_budget = retry_budget
+        self.retries = 0
+
+    def next_delay(self, error, attempt):
+        """
+        다음 재시도까지 기다릴 시간을 반환하는 함수
+
+        :param error: Exception, 방금 발생한 에러
+        :param attempt: int, 지금까지 실패한 시도 횟수 - 1 (첫 실패는 0)
+        :return: float 또는 None, 대기 시간 (None이면 재시도하지 않음)
+        """
+        if not is_retryable(error) or attempt + 1 >= self.max_attempts:
+            return None
+        if self.retries >= self.retry_budget:
+            return None
+
+        delay = retry_after(error)
+        if delay is None:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        else:
+            delay = min(delay, self.max_delay)
+
+        self.retries += 1
+        return delay
+
+
+class AdaptiveRateLimiter:
+    """
+    429 응답에 맞춰 전송 속도를 조절하는 AIMD 방식의 속도 제한기
+    - 처음에는 제한 없이 보내다가, 429를 받으면 그때까지 관측한 전송 속도의 decrease배(기본 70%)로 줄입니다.
+    - 전송 시각 예약에는 속도를 줄인 횟수(generation)를 붙여 두고, 속도를 줄이기 전에 예약한 요청의 429는 무시합니다.
+      동시에 보낸 요청들이 한꺼번에 429를 받아도 속도는 한 번만 줄어듭니다.
+    - 기다리는 동안 속도가 줄었거나 Retry-After로 멈췄으면, 예약한 시각에 보내지 않고 새 속도로 다시 예약합니다.
+    - 이후 성공할 때마다 줄이기 전 속도(ceiling)와의 차이를 약 recovery_seconds에 걸쳐 메우고,
+      그 위로는 초당 약 increase만큼 올립니다.
+    - 429 없이 release_seconds 동안 성공이 이어지면 속도 제한을 풉니다.
+    - Retry-After를 받으면 그 시간 동안 모든 요청을 멈춥니다.
+    """
+
+    def __init__(self, min_rate=0.5, increase=1.0, decrease=0.7, recovery_seconds=5.0, release_seconds=30.0):
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.recovery_seconds = recovery_seconds
+        self.release_seconds = release_seconds
+        self.rate = None
+        self._ceiling = None
+        self._successes = 0
+        self._generation = 0
+        self._interval = None
+        self._last_send = None
+        self._next_send = 0.0
+        self._paused_until = 0.0
+
+    def _reserve(self):
+        """다음 전송 시각을 예약하고, (그때까지 기다릴 시간, 예약 당시 generation)을 반환하는 함수"""
+        now = time.monotonic()
+        start = max(now, self._next_send, self._paused_until)
+        if self._last_send is not None:
+            interval = max(start - self._last_send, 1e-3)
+            self._interval = interval if self._interval is None else 0.9 * self._interval + 0.1 * interval
+        self._last_send = start
+        if self.rate:
+            self._next_send = start + 1.0 / self.rate
+        return start - now, self._generation
+
+    def _is_ready(self, generation):
+        """예약한 뒤 속도가 바뀌지 않았고 멈춤 시간도 지났으면 그대로 보내도 되는지 확인하는 함수"""
+        return generation == self._generation and time.monotonic() >= self._paused_until
+
+    def wait(self):
+        """전송할 차례까지 기다린 뒤 예약의 generation을 반환하는 함수 (429를 받으면 on_rate_limited에 그대로 넘김)"""
+        while True:
+            delay, generation = self._reserve()
+            time.sleep(delay)
+            if self._is_ready(generation):
+                return generation
+
+    async def wait_async(self):
+        while True:
+            delay, generation = self._reserve()
+            await asyncio.sleep(delay)
+            if self._is_ready(generation):
+                return generation
+
+    def on_success(self):
+        if not self.rate:
+            return
+        self._successes += 1
+        if self._successes >= self.rate * self.release_seconds:
+            # 한동안 429가 없었으므로 제한을 풀고, 다음 429에서 관측한 속도로 다시 시작합니다.
+            self.rate = None
+            self._ceiling = None
+            print("429 없이 요청이 이어져 전송 속도 제한 해제")
+            return
+        # 성공이 초당 rate건 들어오므로, 차이를 rate * recovery_seconds로 나눠 더하면 약 recovery_seconds에 회복합니다.
+        gap = max(0.0, self._ceiling - self.rate)
+        self.rate += (gap / self.recovery_seconds + self.increase) / self.rate
+
+    def on_rate_limited(self, delay=None, generation=None):
+        """
+        429 응답을 받았을 때 전송 속도를 줄이는 함수
+
+        :param delay: float, 서버가 준 Retry-After (초)
+        :param generation: int, 429를 받은 요청의 예약 generation (wait의 반환값)
+        """
+        if delay:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        if generation is not None and generation != self._generation:
+            # 이미 줄인 속도로 예약한 요청이 아니므로 다시 줄이지 않습니다.
+            return
+
+        if self.rate is None:
+            observed = 1.0 / self._interval if self._interval else self.min_rate
+            self.rate = observed
+        self._ceiling = self.rate
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self._successes = 0
+        self._generation += 1
+        print(f"429 응답으로 전송 속도 조정: 초당 {self.rate:.2f}건")
@@ -0,0 +1,24 @@
+from openpyxl import Workbook
+
+from data_loader import Question, iter_questions
+
+
+def test_excel_rows_shorter_than_header_are_skipped(tmp_path):
+    path = tmp_path / "problem.xlsx"
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(["id", "question"])
+    sheet.append([1, "첫 번째 질문"])
+    # question 셀이 비어 있으면 write-only 모드는 id 셀만 씁니다.
+    sheet.append([2])
+    sheet.append([3.0, "세 번째 질문"])
+    workbook.save(path)
+
+    assert list(iter_questions(str(path))) == [Question(1, "첫 번째 질문"), Question(3, "세 번째 질문")]
+
+
+def test_csv_blank_question_is_skipped(tmp_path):
+    path = tmp_path / "problem.csv"
+    path.write_text("id,question\n1,질문\n2,\n3\n", encoding="utf-8")
+
+    assert list(iter_questions(str(path))) == [Question(1, "질문")]
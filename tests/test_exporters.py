@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from exporters import COLUMNS, export_parquet, export_results
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def make_rows(ids):
+    return [{"id": id, "question": "질문", "prompt": None, "context": None, "response": "답변",
+             "score": "7.5", "reasoning": None} for id in ids]
+
+
+def test_parquet_keeps_integer_ids(tmp_path):
+    path = tmp_path / "results.parquet"
+    export_results(iter(make_rows([1, 2, 3])), str(path))
+
+    table = pq.read_table(path)
+    assert str(table.schema.field("id").type) == "int64"
+    assert table.column("id").to_pylist() == [1, 2, 3]
+    assert table.column("score").to_pylist() == [7.5, 7.5, 7.5]
+
+
+def test_parquet_switches_to_string_ids_after_first_batch(tmp_path):
+    path = tmp_path / "results.parquet"
+    export_parquet(iter(make_rows([1, 2, 3, "a-4", 5])), str(path), COLUMNS, batch_size=2)
+
+    table = pq.read_table(path)
+    assert table.column("id").to_pylist() == ["1", "2", "3", "a-4", "5"]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_parquet_empty_first_batch_and_dedupe(tmp_path):
+    path = tmp_path / "results.parquet"
+    rows = [{"id": 1, "question": "질문"}] + make_rows([2])
+    export_results(iter(rows), str(path), dedupe=True)
+
+    table = pq.read_table(path)
+    assert table.column_names[:4] == ["id", "question", "prompt_hash", "context_hash"]
+    assert table.column("score").to_pylist() == [None, 7.5]
+    assert pq.read_table(tmp_path / "results.shared.parquet").num_rows == 1
+
+
+def test_exporters_agree_on_ids(tmp_path):
+    export_results(iter(make_rows([1, 2])), str(tmp_path / "results.jsonl"))
+    export_results(iter(make_rows([1, 2])), str(tmp_path / "results.parquet"))
+
+    with open(tmp_path / "results.jsonl", encoding="utf-8") as f:
+        jsonl_ids = [json.loads(line)["id"] for line in f]
+    assert jsonl_ids == pq.read_table(tmp_path / "results.parquet").column("id").to_pylist()
@@ -0,0 +1,33 @@
+import types
+
+from journal import ResultJournal
+
+
+def test_load_results_streams_latest_record_in_order(tmp_path):
+    journal = ResultJournal(str(tmp_path / "results.jsonl"))
+    for id, response in [(1, "a"), (2, "b"), (3, "c"), (2, "b2")]:
+        journal.append({"id": id, "response": response})
+
+    results = journal.load_results(order=[3, 2, 9])
+    assert isinstance(results, types.GeneratorType)
+    assert list(results) == [
+        {"id": 3, "response": "c"},
+        {"id": 2, "response": "b2"},
+        {"id": 1, "response": "a"},
+    ]
+    journal.close()
+
+
+def test_resume_after_truncated_line(tmp_path):
+    path = tmp_path / "results.jsonl"
+    journal = ResultJournal(str(path))
+    journal.append({"id": 1, "response": "가"})
+    journal.close()
+    with open(path, "ab") as f:
+        f.write('{"id": 2, "resp'.encode("utf-8"))
+
+    journal = ResultJournal(str(path), resume=True)
+    assert journal.should_skip(1) and not journal.should_skip(2)
+    journal.append({"id": 2, "response": "나"})
+    assert list(journal.load_results([1, 2])) == [{"id": 1, "response": "가"}, {"id": 2, "response": "나"}]
+    journal.close()
@@ -0,0 +1,17 @@
+from types import SimpleNamespace
+
+from metrics import RunMetrics
+
+
+def test_tokens_per_question_ignores_failed_requests():
+    metrics = RunMetrics()
+    metrics.record_request(0.1, SimpleNamespace(prompt_tokens=400, completion_tokens=20))
+    metrics.record_request(0.3, SimpleNamespace(prompt_tokens=500, completion_tokens=30))
+    # 재시도 끝에 실패한 요청: 지연 시간은 백분위수에 들어가지만 토큰 평균의 분모에는 들어가지 않습니다.
+    metrics.record_request(2.0)
+
+    summary = metrics.summary()
+    assert summary["tokens"]["prompt_per_question"] == 450.0
+    assert summary["tokens"]["completion_per_question"] == 25.0
+    assert summary["latency_ms"]["max"] == 2000.0
+    assert summary["phases"]["request"]["count"] == 3
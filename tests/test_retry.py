@@ -0,0 +1,128 @@
+import heapq
+
+import pytest
+
+import retry
+from retry import AdaptiveRateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(retry.time, "monotonic", clock.monotonic)
+    return clock
+
+
+class TokenBucket:
+    """mock_server.TokenBucket과 같은 규칙의 서버 한도 (가짜 시계 사용)"""
+
+    def __init__(self, clock, rate):
+        self.clock = clock
+        self.rate = rate
+        self.tokens = rate
+        self.updated = 0.0
+
+    def take(self):
+        self.tokens = min(self.rate, self.tokens + (self.clock.now - self.updated) * self.rate)
+        self.updated = self.clock.now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+def simulate(clock, limiter, rows, workers, max_rps, latency=0.1, retry_after=0.1):
+    """
+    워커 workers개가 limiter를 거쳐 rows건을 보내는 실행을 가짜 시계로 재현하는 함수
+    - 워커의 동작은 AdaptiveRateLimiter.wait와 같습니다. (예약 → 대기 → 속도가 바뀌었거나 멈춤 중이면 다시 예약)
+
+    :return: dict, 걸린 시간, 가장 낮았던 전송 속도, 멈춤 중에 보낸 요청 수
+    """
+    bucket = TokenBucket(clock, max_rps)
+    events = []
+    order = 0
+    remaining = rows
+    min_rate = float("inf")
+    sent_while_paused = 0
+
+    def push(at, kind, data=None):
+        nonlocal order
+        order += 1
+        heapq.heappush(events, (at, order, kind, data))
+
+    for _ in range(min(workers, rows)):
+        remaining -= 1
+        push(0.0, "reserve")
+
+    finished = 0
+    while finished < rows:
+        clock.now, _, kind, data = heapq.heappop(events)
+        if kind == "reserve":
+            delay, generation = limiter._reserve()
+            push(clock.now + delay, "ready", generation)
+        elif kind == "ready":
+            if not limiter._is_ready(data):
+                push(clock.now, "reserve")
+                continue
+            if clock.now < limiter._paused_until:
+                sent_while_paused += 1
+            push(clock.now + latency, "done", (data, bucket.take()))
+        elif kind == "done":
+            generation, accepted = data
+            if accepted:
+                limiter.on_success()
+                finished += 1
+                if remaining:
+                    remaining -= 1
+                    push(clock.now, "reserve")
+            else:
+                limiter.on_rate_limited(retry_after, generation)
+                min_rate = min(min_rate, limiter.rate)
+                push(clock.now + retry_after, "reserve")
+
+    return {"elapsed": clock.now, "min_rate": min_rate, "sent_while_paused": sent_while_paused}
+
+
+def test_concurrent_429s_decrease_rate_once(clock):
+    limiter = AdaptiveRateLimiter()
+    generations = [limiter._reserve()[1] for _ in range(16)]
+    clock.now = 0.1
+
+    for generation in generations:
+        limiter.on_rate_limited(0.1, generation)
+
+    assert limiter._generation == 1
+
+
+def test_reservation_made_before_decrease_is_rescheduled(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.rate = 10.0
+    limiter._reserve()
+    delay, generation = limiter._reserve()
+    assert delay > 0
+
+    limiter.on_rate_limited(0.5, limiter._generation)
+    clock.now += delay
+
+    # 예약 시각이 되었어도 속도가 줄었으므로 보내지 않고, 다시 예약하면 멈춤이 끝난 뒤로 잡힙니다.
+    assert not limiter._is_ready(generation)
+    delay, _ = limiter._reserve()
+    assert clock.now + delay >= limiter._paused_until
+
+
+def test_limiter_holds_server_limit(clock, capsys):
+    # mock_server.py --max-rps 40 --retry-after 0.1, 16 워커, 1,000행
+    result = simulate(clock, AdaptiveRateLimiter(), rows=1000, workers=16, max_rps=40)
+
+    assert result["sent_while_paused"] == 0
+    # 한 번의 429 폭주에 속도가 연달아 깎이지 않아야 합니다. (한 번 줄이면 한도의 decrease배 근처)
+    assert result["min_rate"] >= 40 * 0.5
+    assert 1000 / result["elapsed"] >= 40 * 0.8